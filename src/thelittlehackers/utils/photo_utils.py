@@ -21,26 +21,87 @@
 # TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import os
+import re
+import struct
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from functools import lru_cache
+from functools import partial
 from io import BytesIO
+from io import RawIOBase
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import BinaryIO
 
 import exifread
 from PIL import Image
 
-# EXIF_TAG_EXPOSURE_TIME = 0x829A
-# EXIF_TAG_F_NUMBER = 0x829D
-# EXIF_TAG_FOCAL_LENGTH = 0x920A
-# EXIF_TAG_ISO_SPEED_RATINGS = 0x8827
-# EXIF_TAG_ORIENTATION = 0x0112
+if TYPE_CHECKING:
+    import numpy
+
+# Identifiers of Exif tags, as defined by the TIFF/Exif specification.
+EXIF_TAG_ID_EXPOSURE_TIME = 0x829A
+EXIF_TAG_ID_F_NUMBER = 0x829D
+EXIF_TAG_ID_FOCAL_LENGTH = 0x920A
+EXIF_TAG_ID_ISO_SPEED_RATINGS = 0x8827
+EXIF_TAG_ID_ORIENTATION = 0x0112
+EXIF_TAG_ID_DATETIME_ORIGINAL = 0x9003
+EXIF_TAG_ID_OFFSET_TIME_ORIGINAL = 0x9011
+
+# Identifier of the Exif tag which value is the offset of the Exif IFD,
+# which contains most of the Exif tags describing the capture of the
+# photo (e.g., exposure time, capture time).
+EXIF_TAG_ID_EXIF_IFD_POINTER = 0x8769
+
+# Formats (cf. the module `struct`) of the values of the Exif field types
+# indexed by their identifier, as defined by the TIFF specification.  The
+# values of the field types ASCII (2) and UNDEFINED (7) are sequences of
+# bytes.
+EXIF_FIELD_TYPE_FORMATS = {
+    1: 'B',  # BYTE
+    3: 'H',  # SHORT
+    4: 'L',  # LONG
+    5: 'LL',  # RATIONAL
+    6: 'b',  # SBYTE
+    8: 'h',  # SSHORT
+    9: 'l',  # SLONG
+    10: 'll',  # SRATIONAL
+    11: 'f',  # FLOAT
+    12: 'd',  # DOUBLE
+}
+EXIF_FIELD_TYPE_ASCII = 2
+EXIF_FIELD_TYPE_UNDEFINED = 7
+
+# Byte order marks of a TIFF header, which starts the Exif metadata, and
+# their corresponding `struct` byte order characters.
+TIFF_BYTE_ORDERS = {b'II': '<', b'MM': '>'}
 
 # Exif tag which value corresponds to the orientation, which indicates
 # the orientation of the camera relative to the captured scene.
 EXIF_TAG_ORIENTATION = 'Image Orientation'
 
+# Exif tags which values correspond to the date and time when the photo
+# was captured, and the time difference from Universal Time Coordinated
+# (UTC) of this capture time.
+EXIF_TAG_DATETIME_ORIGINAL = 'EXIF DateTimeOriginal'
+EXIF_TAG_OFFSET_TIME_ORIGINAL = 'EXIF OffsetTimeOriginal'
+
+# Sets of the Exif tags to extract to read the capture time of a photo
+# (with or without its time offset), and its orientation.  They are built
+# once, rather than for each photo.
+EXIF_CAPTURE_TIME_TAGS = frozenset((EXIF_TAG_DATETIME_ORIGINAL, EXIF_TAG_OFFSET_TIME_ORIGINAL))
+EXIF_LOCAL_CAPTURE_TIME_TAGS = frozenset((EXIF_TAG_DATETIME_ORIGINAL,))
+EXIF_ORIENTATION_TAGS = frozenset((EXIF_TAG_ORIENTATION,))
+
 # Exif orientation tag values as defined by the TIFF/Exif specification.
 # These values describe how the image should be rotated or flipped to be
 # displayed correctly.  They range from normal orientation (1) to
@@ -54,6 +115,38 @@ EXIF_TAG_ORIENTATION_FLIP_LEFT_RIGHT_ROTATION_90 = 7
 EXIF_TAG_ORIENTATION_FLIP_LEFT_RIGHT_ROTATION_180 = 4
 EXIF_TAG_ORIENTATION_FLIP_LEFT_RIGHT_ROTATION_270 = 5
 
+# Regular expressions of the format of the Exif date and time strings
+# (`YYYY:MM:DD HH:MM:SS`), and of the Exif time offset strings (`±HH:MM`)
+# representing the time difference from Universal Time Coordinated.
+EXIF_DATETIME_PATTERN = re.compile(r'^(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})$', re.ASCII)
+EXIF_TIME_OFFSET_PATTERN = re.compile(r'^([+-])(\d{2}):(\d{2})$', re.ASCII)
+
+# Numbers of bytes progressively read from the beginning of an image file
+# to extract its Exif metadata, until they contain them entirely, and the
+# maximum number of bytes read.  The Exif metadata of a JPEG file are
+# stored in its APP1 segment, which size cannot exceed 64 KB, and which
+# is located at the beginning of the file; they generally fit in the
+# first 8 KB.  HEIC and raw image files may store their Exif metadata
+# further in the file.
+EXIF_HEADER_READ_SIZES = (8192, 24576, 65536)
+EXIF_HEADER_MAXIMUM_SIZE = 262144
+
+# Number of bytes read from the beginning of an image file to extract its
+# orientation, which is one of the first tags of its Exif metadata.
+EXIF_ORIENTATION_HEADER_SIZE = 8192
+
+# Signatures ("magic numbers") of the image file formats that support Exif
+# metadata.  TIFF's signature is also the one of TIFF-based raw formats
+# (e.g., CR2, DNG, NEF), except for Olympus ORF and Panasonic RW2 files
+# which use their own variants.  HEIF files, such as HEIC and AVIF files,
+# start with a `ftyp` box which major brand identifies the kind of file;
+# only the brands that exifread recognises are listed.
+EXIF_JPEG_SIGNATURE = b'\xff\xd8\xff'
+EXIF_TIFF_SIGNATURES = (b'II*\x00', b'MM\x00*', b'IIRO', b'MMOR', b'IIU\x00')
+EXIF_HEIF_FILE_TYPES = frozenset((b'ftypheic', b'ftypavif', b'ftypmif1'))
+EXIF_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+EXIF_JXL_SIGNATURE = b'\x00\x00\x00\x0cJXL \r\n\x87\n'
+
 # Mapping of Exif orientation tag values to corresponding Pillow
 # transposition operations.  Each list defines the sequence of
 # transformations (rotations and/or flips) required to display the
@@ -133,37 +226,744 @@ def __correct_photo_orientation(
     return image
 
 
-def __extract_exif_tags(file: BytesIO | Path) -> dict[str, Any]:
+def __supports_exif(signature: bytes) -> bool:
     """
-    Extract Exif metadata tags from an image file.
+    Indicate whether exifread is able to extract Exif metadata from a file.
+
+    The file formats are identified the same way exifread's function
+    `determine_type` does, so that files exifread would reject (e.g.,
+    videos) are not parsed, while no file it supports is skipped.
+
+
+    :param signature: The first 12 bytes of the file, which identify its
+        format.
+
+
+    :return: `True` if the file is a TIFF (including the TIFF-based raw
+        formats), HEIC, AVIF, WebP, JPEG, PNG or JPEG XL image; `False`
+        otherwise.
+    """
+    return (
+        signature[:2] in TIFF_BYTE_ORDERS
+        or signature[4:12] in EXIF_HEIF_FILE_TYPES
+        or (signature.startswith(b'RIFF') and signature[8:12] == b'WEBP')
+        or signature.startswith(EXIF_JPEG_SIGNATURE[:2])
+        or signature.startswith(EXIF_PNG_SIGNATURE)
+        or signature == EXIF_JXL_SIGNATURE
+    )
+
+
+def __read_file_header(file: BytesIO | Path, header_bytes: int) -> bytes:
+    """
+    Read the header of an image file, where its Exif metadata are expected
+    to be stored.
 
 
     :param file: A file-like object or a file path representing the image
         file.
 
+    :param header_bytes: The number of bytes to read from the beginning
+        of the image file.
 
-    :return: A dictionary mapping Exif tag names to their corresponding
-        values.
+
+    :return: The first bytes of the image file.
 
 
     :raise ValueError: If `file` is neither a `BytesIO` nor a `Path`
         object.
     """
+    # The file is opened unbuffered, as its header is read at once.
     if isinstance(file, Path):
-        with open(file, 'rb') as handle:
-            exif_tags = exifread.process_file(handle)
+        with open(file, 'rb', buffering=0) as handle:
+            header = handle.read(header_bytes)
     elif isinstance(file, BytesIO):
-        file.seek(0)
-        exif_tags = exifread.process_file(file)
+        # Copy the header of the in-memory buffer through a memory view,
+        # which doesn't change the current position of the buffer.  The
+        # memory view is explicitly released, as the buffer can't be
+        # resized as long as a view on its content exists.
+        with file.getbuffer() as buffer, buffer[:header_bytes] as header_buffer:
+            header = bytes(header_buffer)
     else:
         raise ValueError(
             "Invalid file type: expected a file-like object (`BytesIO`) or a file "
             f"path (`Path`), but received {type(file).__name__}."
         )
 
+    return header
+
+
+class __ExifHeaderStream(BytesIO):
+    """
+    In-memory stream of the header of an image file, which records whether
+    exifread attempted to read beyond the end of this header, meaning that
+    the Exif metadata of the image file are not entirely in this header.
+    """
+    truncated = False
+
+    def read(self, size: int | None = -1) -> bytes:
+        data = super().read(size)
+        if size is not None and 0 <= size != len(data):
+            self.truncated = True
+        return data
+
+
+class __BufferStream(RawIOBase):
+    """
+    Read-only stream over the content of an in-memory buffer, which lets
+    exifread walk through this buffer without copying it, nor changing its
+    current position.
+    """
+    def __init__(self, buffer: memoryview):
+        super().__init__()
+        self.__buffer = buffer
+        self.__position = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        # Unlike `RawIOBase.read`, don't allocate `size` bytes upfront, as
+        # exifread may request more bytes than the buffer contains.
+        end = len(self.__buffer) if size is None or size < 0 else self.__position + size
+        with self.__buffer[self.__position:end] as chunk:
+            data = bytes(chunk)
+
+        self.__position += len(data)
+        return data
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, data: memoryview) -> int:
+        with self.__buffer[self.__position:self.__position + len(data)] as chunk:
+            size = len(chunk)
+            data[:size] = chunk
+
+        self.__position += size
+        return size
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.__position
+        elif whence == os.SEEK_END:
+            offset += len(self.__buffer)
+        elif whence != os.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        self.__position = offset
+        return self.__position
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.__position
+
+
+def __iter_file_headers(
+        file: BytesIO | Path,
+        header_bytes: int
+) -> Iterator[tuple[bytes, bool]]:
+    """
+    Iterate over growing headers of an image file.
+
+    The headers are read progressively, with the sizes defined by
+    `EXIF_HEADER_READ_SIZES`, so that the Exif metadata of most image
+    files are found in the first header, while the Exif metadata of image
+    files that store them further in the file are still found without
+    reading the whole file.
+
+
+    :param file: A file-like object or a file path representing the image
+        file.
+
+    :param header_bytes: The maximum number of bytes to read from the
+        beginning of the image file.
+
+
+    :return: An iterator over tuples `(header, end_of_file)`, where
+        `header` is the first bytes of the image file, and `end_of_file`
+        indicates whether `header` contains the whole image file.  The
+        last header yielded is either the whole image file or its first
+        `header_bytes` bytes.
+
+
+    :raise ValueError: If `file` is neither a `BytesIO` nor a `Path`
+        object.
+    """
+    read_sizes = [
+        read_size
+        for read_size in EXIF_HEADER_READ_SIZES
+        if read_size < header_bytes
+    ]
+    read_sizes.append(header_bytes)
+
+    if isinstance(file, Path):
+        # The file is opened unbuffered, as each chunk is read at once.
+        with open(file, 'rb', buffering=0) as handle:
+            header = b''
+            for read_size in read_sizes:
+                header += handle.read(read_size - len(header))
+                end_of_file = len(header) < read_size
+                yield header, end_of_file
+                if end_of_file:
+                    return
+    else:
+        for read_size in read_sizes:
+            header = __read_file_header(file, read_size)
+            end_of_file = len(header) < read_size
+            yield header, end_of_file
+            if end_of_file:
+                return
+
+
+def __parse_exif_tags(
+        header: BinaryIO,
+        stop_tag: str = exifread.DEFAULT_STOP_TAG,
+        details: bool = True,
+        tags: Iterable[str] | None = None
+) -> dict[str, Any]:
+    """
+    Parse the Exif metadata tags from the header of an image file.
+
+
+    :param header: A binary stream of the image file, usually the
+        in-memory stream of its first bytes.
+
+    :param stop_tag: The name of the Exif tag, without its IFD prefix
+        (e.g., `OffsetTimeOriginal`), after which the parsing of an Exif
+        IFD stops.  By default, all the tags are parsed.
+
+    :param details: If `False`, skip the decoding of the MakerNote tags,
+        which is expensive and useless when only a few tags are needed.
+        The thumbnail of the image file is never extracted, whatever the
+        value of this parameter.
+
+    :param tags: The names of the Exif tags to return (e.g.,
+        `EXIF DateTimeOriginal`).  By default, all the tags parsed are
+        returned.
+
+
+    :return: A dictionary mapping Exif tag names to their corresponding
+        values.  This dictionary is empty if the format of the image file
+        doesn't support Exif metadata.
+    """
+    # Don't let exifread scan files which format can't contain Exif
+    # metadata (e.g., videos).
+    if not __supports_exif(header.read(12)):
+        return {}
+
+    exif_tags = exifread.process_file(
+        header,
+        stop_tag=stop_tag,
+        details=details,
+        strict=False,
+        truncate_tags=True,
+        extract_thumbnail=False
+    )
+
+    if tags is not None:
+        wanted_tags = tags if isinstance(tags, (set, frozenset)) else set(tags)
+        exif_tags = {
+            tag_name: tag_value
+            for tag_name, tag_value in exif_tags.items()
+            if tag_name in wanted_tags
+        }
+
     return exif_tags
 
 
+def __extract_exif_tags(
+        file: BytesIO | Path,
+        stop_tag: str = exifread.DEFAULT_STOP_TAG,
+        details: bool = True,
+        header_bytes: int = EXIF_HEADER_MAXIMUM_SIZE,
+        tags: Iterable[str] | None = None
+) -> dict[str, Any]:
+    """
+    Extract Exif metadata tags from an image file.
+
+    Only the header of the image file is read, instead of letting exifread
+    walk through the whole file.  This header is read progressively, until
+    it contains the Exif metadata of the image file (cf. the constant
+    `EXIF_HEADER_READ_SIZES`).  The whole file is parsed only when its
+    Exif metadata extend beyond its first `header_bytes` bytes.
+
+
+    :param file: A file-like object or a file path representing the image
+        file.
+
+    :param stop_tag: The name of the Exif tag, without its IFD prefix
+        (e.g., `OffsetTimeOriginal`), after which the parsing of an Exif
+        IFD stops.  By default, all the tags are parsed.
+
+    :param details: If `False`, skip the decoding of the MakerNote tags,
+        which is expensive and useless when only a few tags are needed.
+
+    :param header_bytes: The maximum number of bytes to read from the
+        beginning of the image file, where its Exif metadata are expected
+        to be stored, before falling back to parsing the whole file.
+
+    :param tags: The names of the Exif tags to return (e.g.,
+        `EXIF DateTimeOriginal`).  By default, all the tags parsed are
+        returned.
+
+
+    :return: A dictionary mapping Exif tag names to their corresponding
+        values.  This dictionary is empty if the format of the image file
+        doesn't support Exif metadata.
+
+
+    :raise ValueError: If `file` is neither a `BytesIO` nor a `Path`
+        object.
+    """
+    if tags is not None and not isinstance(tags, (set, frozenset)):
+        tags = frozenset(tags)
+
+    with closing(__iter_file_headers(file, header_bytes)) as headers:
+        for header, end_of_file in headers:
+            header_stream = __ExifHeaderStream(header)
+            try:
+                exif_tags = __parse_exif_tags(
+                    header_stream,
+                    stop_tag=stop_tag,
+                    details=details,
+                    tags=tags
+                )
+            except Exception:
+                # exifread may fail in many ways when the Exif metadata are
+                # cut at the end of the header.  Read a larger header, unless
+                # the whole file has been read already.
+                if end_of_file:
+                    raise
+                continue
+
+            # Stop reading the image file once the Exif metadata have been
+            # entirely parsed.  The tags parsed from a header that exifread
+            # attempted to read beyond may have truncated values.
+            if end_of_file or not header_stream.truncated:
+                return exif_tags
+
+    # The Exif metadata of the image file extend beyond its first
+    # `header_bytes` bytes (e.g., a TIFF file that stores its IFDs after
+    # its image data).  Let exifread walk through the whole file rather
+    # than returning the tags of a truncated header.
+    if isinstance(file, Path):
+        with open(file, 'rb') as handle:
+            return __parse_exif_tags(
+                handle,
+                stop_tag=stop_tag,
+                details=details,
+                tags=tags
+            )
+
+    # Walk through the in-memory buffer through a memory view, which is
+    # released once parsed, as the buffer can't be resized as long as a
+    # view on its content exists.
+    with file.getbuffer() as buffer, __BufferStream(buffer) as buffer_stream:
+        return __parse_exif_tags(
+            buffer_stream,
+            stop_tag=stop_tag,
+            details=details,
+            tags=tags
+        )
+
+
+def __find_tiff_header(header: bytes) -> int | None:
+    """
+    Find the TIFF header, which starts the Exif metadata, in the header of
+    a JPEG or TIFF image file.
+
+
+    :param header: The first bytes of the image file.
+
+
+    :return: The offset of the TIFF header in `header`, or `None` if the
+        image file doesn't contain Exif metadata.
+
+
+    :raise ValueError: If the image file is neither a JPEG nor a TIFF
+        file, or if `header` is too short to reach the Exif metadata.
+    """
+    if header.startswith(EXIF_TIFF_SIGNATURES):
+        return 0
+
+    if not header.startswith(EXIF_JPEG_SIGNATURE):
+        raise ValueError("Unsupported image file format")
+
+    # Walk through the segments of the JPEG file, from the one following
+    # the Start Of Image (SOI) marker, until the APP1 segment that holds
+    # the Exif metadata.  Each segment starts with a marker `0xFF??`,
+    # followed by the big-endian length of the segment, which doesn't
+    # include the marker.
+    offset = 2
+    while offset + 10 <= len(header):
+        if header[offset] != 0xFF:
+            return None
+
+        marker = header[offset + 1]
+        if marker == 0xFF:  # Fill byte.
+            offset += 1
+            continue
+
+        # The compressed image data start with the Start Of Scan (SOS)
+        # marker: there is no more metadata beyond.
+        if marker in (0xD9, 0xDA):
+            return None
+
+        if marker == 0xE1 and header[offset + 4:offset + 10] == b'Exif\x00\x00':
+            return offset + 10
+
+        offset += 2 + int.from_bytes(header[offset + 2:offset + 4], 'big')
+
+    raise ValueError("The header of the JPEG file is too short to contain its Exif metadata")
+
+
+def __find_ifd_entry(
+        header: bytes,
+        tiff_offset: int,
+        byte_order: str,
+        ifd_offset: int,
+        tag_id: int
+) -> tuple[int, int, int] | None:
+    """
+    Find the entry of a tag in an Image File Directory (IFD).
+
+
+    :param header: The first bytes of the image file.
+
+    :param tiff_offset: The offset of the TIFF header in `header`, from
+        which the offsets of the IFDs and of their values are counted.
+
+    :param byte_order: The `struct` byte order character of the TIFF
+        header (`<` or `>`).
+
+    :param ifd_offset: The offset of the IFD from the TIFF header.
+
+    :param tag_id: The identifier of the tag to find.
+
+
+    :return: A tuple `(field_type, count, value_offset)` of the entry of
+        the tag, where `value_offset` is the offset of the value of the
+        tag in `header`, or `None` if the IFD doesn't contain this tag.
+
+
+    :raise struct.error: If `header` is too short to contain the IFD.
+    """
+    entry_offset = tiff_offset + ifd_offset
+    (entry_count,) = struct.unpack_from(byte_order + 'H', header, entry_offset)
+    entry_offset += 2
+
+    # Each entry of the IFD is 12 bytes long: the tag identifier (2 bytes),
+    # the field type (2 bytes), the number of values (4 bytes), and the
+    # value itself if it fits in 4 bytes, or its offset otherwise.
+    for entry_offset in range(entry_offset, entry_offset + 12 * entry_count, 12):
+        entry_tag_id, field_type, count = struct.unpack_from(byte_order + 'HHL', header, entry_offset)
+        if entry_tag_id != tag_id:
+            continue
+
+        value_format = EXIF_FIELD_TYPE_FORMATS.get(field_type, 'B')
+        if struct.calcsize(byte_order + value_format) * count <= 4:
+            return field_type, count, entry_offset + 8
+
+        (value_offset,) = struct.unpack_from(byte_order + 'L', header, entry_offset + 8)
+        return field_type, count, tiff_offset + value_offset
+
+    return None
+
+
+def read_exif_tag(header: bytes, tag_id: int) -> tuple | str | bytes | None:
+    """
+    Read the value of an Exif tag directly from the header of a JPEG or a
+    TIFF image file.
+
+    This function walks through the first Image File Directory (IFD) of
+    the Exif metadata, and through the Exif IFD, until it finds the tag.
+    It is much faster than parsing all the Exif metadata with exifread,
+    when only one tag is needed.
+
+
+    :param header: The first bytes of the image file (e.g., 64 KB).
+
+    :param tag_id: The identifier of the Exif tag to read (cf. the
+        constants `EXIF_TAG_ID_*`).
+
+
+    :return: The value of the tag: a string for ASCII values, bytes for
+        undefined values, or a tuple of numbers otherwise (a tuple of
+        numerator and denominator pairs for rational values); `None` if
+        the image file doesn't contain this tag.
+
+
+    :raise ValueError: If the image file is neither a JPEG nor a TIFF
+        file, or if `header` is too short to contain the tag.
+    """
+    tiff_offset = __find_tiff_header(header)
+    if tiff_offset is None:
+        return None
+
+    if len(header) < tiff_offset + 8:
+        raise ValueError("The header of the image file is too short to contain the tag")
+
+    byte_order = TIFF_BYTE_ORDERS.get(header[tiff_offset:tiff_offset + 2])
+    if byte_order is None:
+        raise ValueError("Invalid TIFF header in Exif metadata")
+
+    try:
+        (ifd_offset,) = struct.unpack_from(byte_order + 'L', header, tiff_offset + 4)
+        entry = __find_ifd_entry(header, tiff_offset, byte_order, ifd_offset, tag_id)
+
+        # Look for the tag in the Exif IFD if not found in the first IFD.
+        if entry is None and tag_id != EXIF_TAG_ID_EXIF_IFD_POINTER:
+            exif_ifd_entry = __find_ifd_entry(
+                header,
+                tiff_offset,
+                byte_order,
+                ifd_offset,
+                EXIF_TAG_ID_EXIF_IFD_POINTER
+            )
+            if exif_ifd_entry is not None:
+                (exif_ifd_offset,) = struct.unpack_from(byte_order + 'L', header, exif_ifd_entry[2])
+                entry = __find_ifd_entry(header, tiff_offset, byte_order, exif_ifd_offset, tag_id)
+
+        if entry is None:
+            return None
+
+        field_type, count, value_offset = entry
+        if field_type in (EXIF_FIELD_TYPE_ASCII, EXIF_FIELD_TYPE_UNDEFINED) \
+                or field_type not in EXIF_FIELD_TYPE_FORMATS:
+            value = header[value_offset:value_offset + count]
+            if len(value) < count:
+                raise ValueError("The header of the image file is too short to contain the tag")
+
+            if field_type == EXIF_FIELD_TYPE_ASCII:
+                # Drop any garbage after the null terminator.
+                return value.split(b'\x00', 1)[0].decode('utf-8', errors='replace')
+
+            return value
+
+        # The number of values comes from the image file, which may be
+        # corrupted: check that the values fit in the header before
+        # unpacking them, with a repeat count rather than a format string
+        # as long as the number of values.
+        value_format = EXIF_FIELD_TYPE_FORMATS[field_type]
+        if value_offset + struct.calcsize(byte_order + value_format) * count > len(header):
+            raise ValueError("The header of the image file is too short to contain the tag")
+
+        values_format = f'{byte_order}{count * len(value_format)}{value_format[0]}'
+        values = struct.unpack_from(values_format, header, value_offset)
+        if len(value_format) == 2:  # Rational values.
+            values = tuple(zip(values[0::2], values[1::2]))
+
+        return values
+
+    except struct.error as error:
+        raise ValueError("The header of the image file is too short to contain the tag") from error
+
+
+@lru_cache(maxsize=64)
+def __get_timezone(offset_minutes: int) -> timezone:
+    """
+    Return the time zone corresponding to a time difference from Universal
+    Time Coordinated.
+
+    The time zones are cached, as the photos of a same set are most likely
+    captured with the same time difference.
+
+
+    :param offset_minutes: The time difference from UTC, in minutes.
+
+
+    :return: The time zone with this fixed time difference from UTC.
+    """
+    return timezone(timedelta(minutes=offset_minutes))
+
+
+def __get_capture_time_from_exif_tags(exif_tags: dict[str, Any]) -> datetime | None:
+    """
+    Return the capture time of a photo from its Exif tags.
+
+
+    :param exif_tags: A dictionary of Exif tags extracted from the image
+        metadata.
+
+
+    :return: The capture time of the photo, timezone-aware if the Exif tag
+        representing the time difference from Universal Time Coordinated
+        is present, or `None` if the capture time is not defined.
+
+
+    :raise ValueError: If the capture time is improperly formatted in the
+        Exif metadata.
+    """
+    # Extract the date and time when the photo was captured.  Some cameras
+    # may include the Exif `OffsetTimeOriginal` tag, which specifies the
+    # time zone offset (e.g., `+07:00` or `-05:00`).
+    exif_datetime = exif_tags.get(EXIF_TAG_DATETIME_ORIGINAL)
+    exif_offset = exif_tags.get(EXIF_TAG_OFFSET_TIME_ORIGINAL)
+
+    if not exif_datetime:
+        return None
+
+    # Validate the Exif date string, which has the fixed-width format
+    # `YYYY:MM:DD HH:MM:SS`, and extract its components at once, rather
+    # than having the much slower `datetime.strptime` parse it.
+    #
+    # The raw values of the Exif tags are used, rather than their string
+    # representation, which is built for display.  The value of an ASCII
+    # tag is a string, unless exifread failed to decode it, in which case
+    # it is left as bytes.
+    datetime_value = exif_datetime.values
+    datetime_match = isinstance(datetime_value, str) and EXIF_DATETIME_PATTERN.fullmatch(datetime_value)
+    if not datetime_match:
+        raise ValueError("Invalid date format in Exif metadata")
+
+    offset_match = None
+    if exif_offset:
+        offset_value = exif_offset.values
+        offset_match = isinstance(offset_value, str) and EXIF_TIME_OFFSET_PATTERN.fullmatch(offset_value.strip())
+        if not offset_match:
+            raise ValueError("Invalid date format in Exif metadata")
+
+    try:
+        # Convert the Exif date string to a naive datetime object.
+        year, month, day, hour, minute, second = map(int, datetime_match.groups())
+        capture_time = datetime(year, month, day, hour, minute, second)
+    except ValueError:  # The date or the time is out of range.
+        raise ValueError("Invalid date format in Exif metadata")
+
+    if offset_match:
+        # Convert the Exif offset string to a timezone-aware datetime.
+        sign, hours, minutes = offset_match.groups()
+        offset_minutes = (int(hours) * 60 + int(minutes)) * (-1 if sign == '-' else 1)
+        capture_time = capture_time.replace(tzinfo=__get_timezone(offset_minutes))
+
+    return capture_time
+
+
+def __read_photo_capture_time(file: BytesIO | Path) -> datetime | None:
+    """
+    Read the capture time of a photo from the Exif metadata of its image
+    file.
+
+
+    :param file: A file-like object or a file path representing the image
+        file.
+
+
+    :return: The capture time of the photo, or `None` if not defined.
+
+
+    :raise ValueError: If the capture time is improperly formatted in the
+        Exif metadata.
+    """
+    # Stop parsing the Exif metadata as soon as the time zone offset tag
+    # is read.  This tag is the last one we need, as the tags of an IFD
+    # are sorted by their identifier (`DateTimeOriginal` is 0x9003, and
+    # `OffsetTimeOriginal` is 0x9011).
+    exif_tags = __extract_exif_tags(
+        file,
+        stop_tag='OffsetTimeOriginal',
+        details=False,
+        tags=EXIF_CAPTURE_TIME_TAGS
+    )
+    return __get_capture_time_from_exif_tags(exif_tags)
+
+
+def __read_photo_capture_time_string(file_path: Path) -> str | None:
+    """
+    Read the capture time of a photo from the Exif metadata of its image
+    file, without converting it to a `datetime` object.
+
+
+    :param file_path: The file path of the photo's image file.
+
+
+    :return: The Exif date string of the capture time of the photo, with
+        the format `YYYY:MM:DD HH:MM:SS`, or `None` if the capture time is
+        missing or improperly formatted.
+    """
+    exif_tags = __extract_exif_tags(
+        file_path,
+        stop_tag='DateTimeOriginal',
+        details=False,
+        tags=EXIF_LOCAL_CAPTURE_TIME_TAGS
+    )
+
+    exif_datetime = exif_tags.get(EXIF_TAG_DATETIME_ORIGINAL)
+    if not exif_datetime:
+        return None
+
+    datetime_value = exif_datetime.values
+    datetime_match = isinstance(datetime_value, str) and EXIF_DATETIME_PATTERN.fullmatch(datetime_value)
+    return datetime_value if datetime_match else None
+
+
+@lru_cache(maxsize=8192)
+def __read_photo_file_capture_time(
+        file_path: str,
+        modification_time: int,
+        file_size: int
+) -> datetime | None:
+    """
+    Read the capture time of a photo from the Exif metadata of its image
+    file, caching the result.
+
+    The modification time and the size of the file are not used to read
+    the capture time, but they are part of the cache key so that a file
+    that has been modified since it was cached is read again.
+
+
+    :param file_path: The absolute path of the image file.
+
+    :param modification_time: The modification time of the file, in
+        nanoseconds.
+
+    :param file_size: The size of the file, in bytes.
+
+
+    :return: The capture time of the photo, or `None` if not defined.
+
+
+    :raise ValueError: If the capture time is improperly formatted in the
+        Exif metadata.
+    """
+    return __read_photo_capture_time(Path(file_path))
+
+
+def __map_concurrently(
+        function: Callable[[Path], Any],
+        file_paths: Sequence[Path],
+        max_workers: int | None = None
+) -> list[Any]:
+    """
+    Apply a function to a list of file paths, using a pool of threads.
+
+
+    :param function: The function to apply to each file path.
+
+    :param file_paths: The file paths.
+
+    :param max_workers: The maximum number of threads.  Defaults to four
+        threads per CPU, up to 32 threads.
+
+
+    :return: The list of the results of the function, in the same order
+        as the file paths.
+
+
+    :raise Exception: The first exception raised by the function.
+    """
+    if len(file_paths) <= 1:
+        return [function(file_path) for file_path in file_paths]
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        return list(executor.map(function, file_paths))
+
+
 def get_photo_capture_time(
         file: BytesIO | Path,
         strict: bool = True
@@ -171,9 +971,12 @@ def get_photo_capture_time(
     """
     Retrieve the capture time of a photo from its Exif metadata.
 
+    The capture time of a photo file is cached, as long as the file is
+    not modified.  The capture time of an in-memory photo is not cached.
+
 
     :param file: A file-like object (e.g., an in-memory bytes buffer)
-        representing the photo's image file.
+        or a file path representing the photo's image file.
 
     :param strict: If `True`, raises a `ValueError` when the capture time
         is missing from the Exif metadata.
@@ -188,36 +991,222 @@ def get_photo_capture_time(
     :raise ValueError: If the capture time is missing, while the argument
         `strict` is `True`, or improperly formatted in the Exif metadata.
     """
-    exif_tags = __extract_exif_tags(file)
-
-    # Extract the date and time when the photo was captured.  Some cameras
-    # may include the Exif `OffsetTimeOriginal` tag, which specifies the
-    # time zone offset (e.g., `+07:00` or `-05:00`).
-    exif_datetime = exif_tags.get('EXIF DateTimeOriginal')
-    exif_offset = exif_tags.get('EXIF OffsetTimeOriginal')
-
-    if exif_datetime:
-        try:
-            # Convert the Exif date string to a naive datetime object.
-            capture_time = datetime.strptime(str(exif_datetime), "%Y:%m:%d %H:%M:%S")
-
-            if exif_offset:
-                # Convert the Exif offset string to a timezone-aware datetime.
-                offset_str = str(exif_offset).strip()
-                sign = 1 if offset_str.startswith("+") else -1
-                hours, minutes = map(int, offset_str[1:].split(":"))
-                tz_offset = timedelta(hours=hours, minutes=minutes) * sign
-                capture_time = capture_time.replace(tzinfo=timezone(tz_offset))
-        except ValueError:
-            raise ValueError("Invalid date format in Exif metadata")
+    if isinstance(file, Path):
+        file_stat = file.stat()
+        capture_time = __read_photo_file_capture_time(
+            str(file.absolute()),
+            file_stat.st_mtime_ns,
+            file_stat.st_size
+        )
     else:
-        if strict:
-            raise ValueError("The photo does not contain capture date and time information")
-        capture_time = None
+        capture_time = __read_photo_capture_time(file)
+
+    if capture_time is None and strict:
+        raise ValueError("The photo does not contain capture date and time information")
 
     return capture_time
 
 
+def get_photo_capture_times(
+        file_paths: Sequence[Path],
+        strict: bool = True,
+        max_workers: int | None = None
+) -> list[datetime | None]:
+    """
+    Retrieve the capture time of a list of photos from their Exif
+    metadata.
+
+    The image files are read concurrently, as reading their Exif metadata
+    is mostly spent waiting for blocking read system calls, during which
+    the Global Interpreter Lock is released.
+
+
+    :param file_paths: The file paths of the photos' image files.
+
+    :param strict: If `True`, raises a `ValueError` when the capture time
+        of a photo is missing from its Exif metadata.
+
+    :param max_workers: The maximum number of threads used to read the
+        image files.  Defaults to four threads per CPU, up to 32 threads.
+
+
+    :return: The list of the capture times of the photos, in the same
+        order as their file paths.  The capture time of a photo is `None`
+        if unavailable (cf. `get_photo_capture_time`).
+
+
+    :raise ValueError: If the capture time of a photo is missing, while
+        the argument `strict` is `True`, or improperly formatted in the
+        Exif metadata.
+    """
+    return __map_concurrently(
+        partial(get_photo_capture_time, strict=strict),
+        file_paths,
+        max_workers=max_workers
+    )
+
+
+def get_photo_capture_times_as_arrays(
+        file_paths: Sequence[Path],
+        max_workers: int | None = None
+) -> tuple['numpy.ndarray', 'numpy.ndarray']:
+    """
+    Retrieve the capture time of a list of photos from their Exif
+    metadata, as columnar arrays.
+
+    Contrary to `get_photo_capture_times`, no `datetime` object is built:
+    the capture times are parsed at once into a NumPy array, which allows
+    vectorized sorting and filtering of large sets of photos, with a much
+    smaller memory footprint.
+
+    NumPy datetimes are not timezone-aware.  The capture times are the
+    local date and time of the photos, as recorded by the camera; the
+    time difference from Universal Time Coordinated, if any, is ignored.
+
+    This function requires NumPy, which is installed with the extra
+    `numpy` of this library.
+
+
+    :param file_paths: The file paths of the photos' image files.
+
+    :param max_workers: The maximum number of threads used to read the
+        image files.  Defaults to four threads per CPU, up to 32 threads.
+
+
+    :return: A tuple `(times, valid_mask)` of two arrays of the same
+        length as `file_paths`, in the same order:
+
+        - `times`: a `datetime64[us]` array of the capture times of the
+          photos, `NaT` when the capture time of a photo is missing or
+          improperly formatted;
+
+        - `valid_mask`: a boolean array which elements are `True` when
+          the capture time of the photo is available.
+
+
+    :raise ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "NumPy is required to retrieve capture times as arrays; install "
+            "the extra `numpy` of this library"
+        ) from error
+
+    exif_datetime_strings = __map_concurrently(
+        __read_photo_capture_time_string,
+        file_paths,
+        max_workers=max_workers
+    )
+
+    # Convert the Exif date strings (`YYYY:MM:DD HH:MM:SS`) to ISO 8601
+    # date strings (`YYYY-MM-DD HH:MM:SS`), by replacing the separators
+    # of the date, i.e., the first two colons, and let NumPy parse them
+    # all at once.
+    datetime_strings = [
+        'NaT' if exif_datetime_string is None else exif_datetime_string.replace(':', '-', 2)
+        for exif_datetime_string in exif_datetime_strings
+    ]
+
+    try:
+        times = numpy.array(datetime_strings, dtype='datetime64[us]')
+    except ValueError:
+        # The date or the time of at least one photo is out of range (e.g.,
+        # a month `13`).  Parse the date strings one by one, to only reject
+        # the improperly formatted ones.
+        def parse_datetime_string(datetime_string: str) -> 'numpy.datetime64':
+            try:
+                return numpy.datetime64(datetime_string, 'us')
+            except ValueError:
+                return numpy.datetime64('NaT', 'us')
+
+        times = numpy.fromiter(
+            map(parse_datetime_string, datetime_strings),
+            dtype='datetime64[us]',
+            count=len(datetime_strings)
+        )
+
+    valid_mask = ~numpy.isnat(times)
+
+    return times, valid_mask
+
+
+def get_photo_orientation(
+        file: BytesIO | Path,
+        strict: bool = False
+) -> int | None:
+    """
+    Retrieve the orientation of a photo from its Exif metadata.
+
+    The orientation indicates how the camera was positioned relative to
+    the captured scene, and therefore which transformation needs to be
+    applied to the image to display it correctly:
+
+    - `1`: no transformation required;
+    - `2`: flip horizontally;
+    - `3`: rotate by 180 degrees;
+    - `4`: flip vertically;
+    - `5`: flip horizontally, then rotate by 90 degrees counterclockwise;
+    - `6`: rotate by 90 degrees clockwise;
+    - `7`: flip horizontally, then rotate by 90 degrees clockwise;
+    - `8`: rotate by 90 degrees counterclockwise.
+
+    The photo is rotated, i.e., its width and height are swapped when it
+    is displayed, when its orientation is `5`, `6`, `7` or `8`.
+
+    The orientation tag is one of the first tags of the first IFD of the
+    Exif metadata, so only the first bytes of the image file are parsed,
+    and they are parsed directly, without exifread, for JPEG and TIFF
+    files.
+
+
+    :param file: A file-like object (e.g., an in-memory bytes buffer)
+        or a file path representing the photo's image file.
+
+    :param strict: If `True`, raises a `ValueError` when the orientation
+        is missing from the Exif metadata, or when its value is invalid.
+
+
+    :return: The Exif orientation value of the photo, from `1` to `8`
+        (cf. the constants `EXIF_TAG_ORIENTATION_*`), or `None` if the
+        orientation is unavailable.
+
+
+    :raise ValueError: If the orientation is missing or invalid, while the
+        argument `strict` is `True`.
+    """
+    header = __read_file_header(file, EXIF_ORIENTATION_HEADER_SIZE)
+
+    try:
+        orientation_values = read_exif_tag(header, EXIF_TAG_ID_ORIENTATION)
+    except ValueError:
+        # The image file is neither a JPEG nor a TIFF file (e.g., HEIC),
+        # or its orientation is not in its first bytes; let exifread parse
+        # it.
+        exif_tags = __extract_exif_tags(
+            file,
+            stop_tag='Orientation',
+            details=False,
+            tags=EXIF_ORIENTATION_TAGS
+        )
+        exif_tag_orientation = exif_tags.get(EXIF_TAG_ORIENTATION)
+        orientation_values = exif_tag_orientation and exif_tag_orientation.values
+
+    if not orientation_values or not isinstance(orientation_values, (list, tuple)):
+        if strict:
+            raise ValueError("The photo does not contain orientation information")
+        return None
+
+    orientation = orientation_values[0]
+    if orientation not in EXIF_PIL_TRANSPOSITIONS:
+        if strict:
+            raise ValueError(f"Invalid orientation {orientation} in Exif metadata")
+        return None
+
+    return orientation
+
+
 # def get_photo_location(file: BytesIO | Path):
 #     """
 #     Parse out the GPS coordinates from the Exif tags of a photo file.
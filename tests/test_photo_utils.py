@@ -0,0 +1,675 @@
+# MIT License
+#
+# Copyright (C) 2024 The Little Hackers.  All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import os
+import struct
+import zlib
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from io import BytesIO
+
+import pytest
+
+from thelittlehackers.utils import photo_utils
+from thelittlehackers.utils.photo_utils import EXIF_HEADER_MAXIMUM_SIZE
+from thelittlehackers.utils.photo_utils import EXIF_HEADER_READ_SIZES
+from thelittlehackers.utils.photo_utils import EXIF_TAG_ID_DATETIME_ORIGINAL
+from thelittlehackers.utils.photo_utils import EXIF_TAG_ID_EXIF_IFD_POINTER
+from thelittlehackers.utils.photo_utils import EXIF_TAG_ID_EXPOSURE_TIME
+from thelittlehackers.utils.photo_utils import EXIF_TAG_ID_F_NUMBER
+from thelittlehackers.utils.photo_utils import EXIF_TAG_ID_ISO_SPEED_RATINGS
+from thelittlehackers.utils.photo_utils import EXIF_TAG_ID_OFFSET_TIME_ORIGINAL
+from thelittlehackers.utils.photo_utils import EXIF_TAG_ID_ORIENTATION
+from thelittlehackers.utils.photo_utils import get_photo_capture_time
+from thelittlehackers.utils.photo_utils import get_photo_capture_times
+from thelittlehackers.utils.photo_utils import get_photo_orientation
+from thelittlehackers.utils.photo_utils import read_exif_tag
+
+
+find_ifd_entry = photo_utils.__find_ifd_entry
+find_tiff_header = photo_utils.__find_tiff_header
+
+FIELD_TYPE_ASCII = 2
+FIELD_TYPE_SHORT = 3
+FIELD_TYPE_LONG = 4
+FIELD_TYPE_RATIONAL = 5
+FIELD_TYPE_UNDEFINED = 7
+
+TAG_ID_IMAGE_DESCRIPTION = 0x010E
+
+BYTE_ORDERS = {b'II': '<', b'MM': '>'}
+
+DATETIME_ORIGINAL = b'2024:01:02 03:04:05\x00'
+OFFSET_TIME_ORIGINAL = b'+07:00\x00'
+
+CAPTURE_TIME = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=7)))
+
+JFIF_PAYLOAD = b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+
+
+def build_tiff(tiff_byte_order, ifd0_entries, exif_ifd_entries=None, image_data_size=0):
+    """
+    Build the bytes of a TIFF structure, as stored in the Exif metadata.
+
+    The IFD0 is stored after the TIFF header and the image data, if any,
+    followed by the Exif IFD, if any, and then by the values that don't
+    fit in their entry.
+
+
+    :param tiff_byte_order: The byte order of the TIFF header (`II` or
+        `MM`).
+
+    :param ifd0_entries: A list of tuples `(tag_id, field_type, count,
+        value)` of the entries of the IFD0, where `value` is the packed
+        value of the tag.
+
+    :param exif_ifd_entries: A list of the entries of the Exif IFD, if
+        any.  The entry of the Exif IFD pointer is added to the IFD0.
+
+    :param image_data_size: The number of bytes of dummy image data to
+        store between the TIFF header and the IFD0, as TIFF files that
+        store their IFDs after their image data do.
+
+
+    :return: The bytes of the TIFF structure.
+    """
+    byte_order = BYTE_ORDERS[tiff_byte_order]
+    ifd0_entries = list(ifd0_entries)
+    ifds = [ifd0_entries]
+    if exif_ifd_entries is not None:
+        ifd0_entries.append((EXIF_TAG_ID_EXIF_IFD_POINTER, FIELD_TYPE_LONG, 1, None))
+        ifds.append(list(exif_ifd_entries))
+
+    # Compute the offset of each IFD, and of the data area that follows.
+    ifd_offsets = []
+    offset = 8 + image_data_size
+    for entries in ifds:
+        ifd_offsets.append(offset)
+        offset += 2 + 12 * len(entries) + 4
+
+    data = b''
+    data_offset = offset
+    encoded_ifds = b''
+    for entries in ifds:
+        encoded_ifd = struct.pack(byte_order + 'H', len(entries))
+        for tag_id, field_type, count, value in entries:
+            if tag_id == EXIF_TAG_ID_EXIF_IFD_POINTER:
+                value = struct.pack(byte_order + 'L', ifd_offsets[1])
+
+            if len(value) <= 4:
+                value_field = value.ljust(4, b'\x00')
+            else:
+                value_field = struct.pack(byte_order + 'L', data_offset + len(data))
+                data += value
+
+            encoded_ifd += struct.pack(byte_order + 'HHL', tag_id, field_type, count) + value_field
+
+        encoded_ifds += encoded_ifd + struct.pack(byte_order + 'L', 0)
+
+    tiff_header = tiff_byte_order + struct.pack(byte_order + 'HL', 42, ifd_offsets[0])
+    return tiff_header + b'\x00' * image_data_size + encoded_ifds + data
+
+
+def build_jpeg(*segments):
+    """
+    Build the bytes of the header of a JPEG file.
+
+
+    :param segments: A list of tuples `(marker, payload)` of the segments
+        to store after the Start Of Image (SOI) marker.
+
+
+    :return: The bytes of the JPEG file, followed by a Start Of Scan
+        (SOS) segment, dummy compressed image data, and the End Of Image
+        (EOI) marker.
+    """
+    jpeg = b'\xff\xd8'
+    for marker, payload in segments:
+        jpeg += bytes((0xFF, marker)) + struct.pack('>H', len(payload) + 2) + payload
+
+    return jpeg + b'\xff\xda\x00\x02' + b'\x00' * 16 + b'\xff\xd9'
+
+
+def build_capture_time_tiff(
+        tiff_byte_order,
+        datetime_original=DATETIME_ORIGINAL,
+        offset_time_original=OFFSET_TIME_ORIGINAL,
+        image_data_size=0):
+    """
+    Build the bytes of a TIFF structure which Exif metadata contain the
+    orientation and the capture time of the photo.
+
+
+    :param tiff_byte_order: The byte order of the TIFF header (`II` or
+        `MM`).
+
+    :param datetime_original: The packed value of the DateTimeOriginal
+        tag.
+
+    :param offset_time_original: The packed value of the
+        OffsetTimeOriginal tag, or `None` to omit this tag.
+
+    :param image_data_size: The number of bytes of dummy image data to
+        store before the IFDs.
+
+
+    :return: The bytes of the TIFF structure.
+    """
+    byte_order = BYTE_ORDERS[tiff_byte_order]
+    exif_ifd_entries = [(EXIF_TAG_ID_DATETIME_ORIGINAL, FIELD_TYPE_ASCII, len(datetime_original), datetime_original)]
+    if offset_time_original is not None:
+        exif_ifd_entries.append(
+            (EXIF_TAG_ID_OFFSET_TIME_ORIGINAL, FIELD_TYPE_ASCII, len(offset_time_original), offset_time_original)
+        )
+
+    return build_tiff(
+        tiff_byte_order,
+        [(EXIF_TAG_ID_ORIENTATION, FIELD_TYPE_SHORT, 1, struct.pack(byte_order + 'H', 6))],
+        exif_ifd_entries,
+        image_data_size=image_data_size
+    )
+
+
+def build_capture_time_jpeg(tiff_byte_order, scan_data_size=0, **kwargs):
+    """
+    Build the bytes of a JPEG file which Exif metadata contain the
+    capture time of the photo.
+
+
+    :param tiff_byte_order: The byte order of the TIFF header (`II` or
+        `MM`).
+
+    :param scan_data_size: The number of bytes of dummy compressed image
+        data to append to the JPEG file.
+
+    :param kwargs: The tag values passed to `build_capture_time_tiff`.
+
+
+    :return: The bytes of the JPEG file.
+    """
+    jpeg = build_jpeg(
+        (0xE0, JFIF_PAYLOAD),
+        (0xE1, b'Exif\x00\x00' + build_capture_time_tiff(tiff_byte_order, **kwargs)),
+    )
+    return jpeg[:-2] + b'\x00' * scan_data_size + jpeg[-2:]
+
+
+def build_straddling_capture_time_tiff(tiff_byte_order, boundary, tiff_offset=0):
+    """
+    Build the bytes of a TIFF structure which DateTimeOriginal value
+    straddles a given offset of the image file.
+
+
+    :param tiff_byte_order: The byte order of the TIFF header (`II` or
+        `MM`).
+
+    :param boundary: The offset in the image file that the value of the
+        DateTimeOriginal tag straddles.
+
+    :param tiff_offset: The offset of the TIFF structure in the image
+        file.
+
+
+    :return: The bytes of the TIFF structure.
+    """
+    # The values stored at an offset follow the IFD0 (Orientation,
+    # ImageDescription and Exif IFD pointer) and the Exif IFD
+    # (DateTimeOriginal and OffsetTimeOriginal), in the order of their
+    # entries.  The ImageDescription value pushes the DateTimeOriginal one
+    # across the boundary.
+    data_offset = tiff_offset + 8 + (2 + 12 * 3 + 4) + (2 + 12 * 2 + 4)
+    description = b'x' * (boundary - len(DATETIME_ORIGINAL) // 2 - data_offset - 1) + b'\x00'
+
+    byte_order = BYTE_ORDERS[tiff_byte_order]
+    return build_tiff(
+        tiff_byte_order,
+        [
+            (EXIF_TAG_ID_ORIENTATION, FIELD_TYPE_SHORT, 1, struct.pack(byte_order + 'H', 6)),
+            (TAG_ID_IMAGE_DESCRIPTION, FIELD_TYPE_ASCII, len(description), description),
+        ],
+        [
+            (EXIF_TAG_ID_DATETIME_ORIGINAL, FIELD_TYPE_ASCII, len(DATETIME_ORIGINAL), DATETIME_ORIGINAL),
+            (EXIF_TAG_ID_OFFSET_TIME_ORIGINAL, FIELD_TYPE_ASCII, len(OFFSET_TIME_ORIGINAL), OFFSET_TIME_ORIGINAL),
+        ]
+    )
+
+
+def build_jxl(tiff):
+    """
+    Build the bytes of a JPEG XL container which Exif box holds a TIFF
+    structure.
+    """
+    def box(box_type, payload):
+        return struct.pack('>I', len(payload) + 8) + box_type + payload
+
+    return b'\x00\x00\x00\x0cJXL \r\n\x87\n' \
+        + box(b'ftyp', b'jxl \x00\x00\x00\x00jxl ') \
+        + box(b'Exif', b'\x00\x00\x00\x00' + tiff) \
+        + box(b'jxlc', b'\x00' * 16)
+
+
+def build_png(tiff):
+    """
+    Build the bytes of a PNG file which eXIf chunk holds a TIFF structure.
+    """
+    def chunk(chunk_type, payload):
+        return struct.pack('>I', len(payload)) + chunk_type + payload \
+            + struct.pack('>I', zlib.crc32(chunk_type + payload))
+
+    return b'\x89PNG\r\n\x1a\n' \
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', 1, 1, 8, 2, 0, 0, 0)) \
+        + chunk(b'eXIf', tiff) \
+        + chunk(b'IEND', b'')
+
+
+def build_webp(tiff):
+    """
+    Build the bytes of an extended WebP file which EXIF chunk holds a TIFF
+    structure.
+    """
+    def chunk(chunk_type, payload):
+        return chunk_type + struct.pack('<I', len(payload)) + payload + b'\x00' * (len(payload) % 2)
+
+    payload = b'WEBP' \
+        + chunk(b'VP8X', b'\x08\x00\x00\x00' + b'\x00' * 6) \
+        + chunk(b'EXIF', b'Exif\x00\x00' + tiff)
+    return b'RIFF' + struct.pack('<I', len(payload)) + payload
+
+
+@pytest.fixture(params=list(BYTE_ORDERS))
+def tiff_byte_order(request):
+    return request.param
+
+
+@pytest.fixture
+def exif_parse_sizes(monkeypatch):
+    """
+    Record the size of the stream of each call to exifread.
+    """
+    sizes = []
+    process_file = photo_utils.exifread.process_file
+
+    def record_process_file(fh, **kwargs):
+        position = fh.tell()
+        sizes.append(fh.seek(0, os.SEEK_END))
+        fh.seek(position)
+        return process_file(fh, **kwargs)
+
+    monkeypatch.setattr(photo_utils.exifread, 'process_file', record_process_file)
+    return sizes
+
+
+def test_read_exif_tag_inline_short(tiff_byte_order):
+    tiff = build_capture_time_tiff(tiff_byte_order)
+    assert read_exif_tag(tiff, EXIF_TAG_ID_ORIENTATION) == (6,)
+
+
+def test_read_exif_tag_offset_values(tiff_byte_order):
+    byte_order = BYTE_ORDERS[tiff_byte_order]
+    iso_speed_ratings = (100, 200, 400)
+    tiff = build_tiff(
+        tiff_byte_order,
+        [
+            (
+                EXIF_TAG_ID_ISO_SPEED_RATINGS,
+                FIELD_TYPE_SHORT,
+                len(iso_speed_ratings),
+                struct.pack(byte_order + 'HHH', *iso_speed_ratings)
+            )
+        ]
+    )
+    assert read_exif_tag(tiff, EXIF_TAG_ID_ISO_SPEED_RATINGS) == iso_speed_ratings
+
+
+def test_read_exif_tag_ascii_with_trailing_nuls(tiff_byte_order):
+    tiff = build_tiff(
+        tiff_byte_order,
+        [
+            # Stored inline.
+            (EXIF_TAG_ID_OFFSET_TIME_ORIGINAL, FIELD_TYPE_ASCII, 4, b'Z\x00\x00\x00'),
+            # Stored at an offset, followed by padding and garbage.
+            (EXIF_TAG_ID_DATETIME_ORIGINAL, FIELD_TYPE_ASCII, 24, DATETIME_ORIGINAL + b'\x00\x00x\x00'),
+        ]
+    )
+    assert read_exif_tag(tiff, EXIF_TAG_ID_OFFSET_TIME_ORIGINAL) == 'Z'
+    assert read_exif_tag(tiff, EXIF_TAG_ID_DATETIME_ORIGINAL) == '2024:01:02 03:04:05'
+
+
+def test_read_exif_tag_rational(tiff_byte_order):
+    byte_order = BYTE_ORDERS[tiff_byte_order]
+    tiff = build_tiff(
+        tiff_byte_order,
+        [],
+        [
+            (EXIF_TAG_ID_EXPOSURE_TIME, FIELD_TYPE_RATIONAL, 1, struct.pack(byte_order + 'LL', 1, 250)),
+            (EXIF_TAG_ID_F_NUMBER, FIELD_TYPE_RATIONAL, 2, struct.pack(byte_order + 'LLLL', 28, 10, 4, 1)),
+        ]
+    )
+    assert read_exif_tag(tiff, EXIF_TAG_ID_EXPOSURE_TIME) == ((1, 250),)
+    assert read_exif_tag(tiff, EXIF_TAG_ID_F_NUMBER) == ((28, 10), (4, 1))
+
+
+def test_read_exif_tag_undefined(tiff_byte_order):
+    tiff = build_tiff(tiff_byte_order, [(0x9000, FIELD_TYPE_UNDEFINED, 4, b'0232')])
+    assert read_exif_tag(tiff, 0x9000) == b'0232'
+
+
+def test_read_exif_tag_in_exif_ifd_only(tiff_byte_order):
+    tiff = build_capture_time_tiff(tiff_byte_order)
+    assert read_exif_tag(tiff, EXIF_TAG_ID_DATETIME_ORIGINAL) == '2024:01:02 03:04:05'
+    assert read_exif_tag(tiff, EXIF_TAG_ID_OFFSET_TIME_ORIGINAL) == '+07:00'
+
+
+def test_read_exif_tag_missing(tiff_byte_order):
+    tiff = build_capture_time_tiff(tiff_byte_order)
+    assert read_exif_tag(tiff, EXIF_TAG_ID_EXPOSURE_TIME) is None
+
+    tiff = build_tiff(tiff_byte_order, [])
+    assert read_exif_tag(tiff, EXIF_TAG_ID_DATETIME_ORIGINAL) is None
+
+
+def test_read_exif_tag_jpeg(tiff_byte_order):
+    jpeg = build_jpeg(
+        (0xE0, JFIF_PAYLOAD),
+        (0xE1, b'Exif\x00\x00' + build_capture_time_tiff(tiff_byte_order)),
+    )
+    assert read_exif_tag(jpeg, EXIF_TAG_ID_ORIENTATION) == (6,)
+    assert read_exif_tag(jpeg, EXIF_TAG_ID_DATETIME_ORIGINAL) == '2024:01:02 03:04:05'
+
+
+def test_read_exif_tag_jpeg_without_exif():
+    jpeg = build_jpeg(
+        (0xE0, JFIF_PAYLOAD),
+        (0xE1, b'http://ns.adobe.com/xap/1.0/\x00<x:xmpmeta/>'),
+    )
+    assert read_exif_tag(jpeg, EXIF_TAG_ID_ORIENTATION) is None
+
+
+def test_read_exif_tag_truncated_header(tiff_byte_order):
+    tiff = build_capture_time_tiff(tiff_byte_order)
+
+    # Cut in the TIFF header.
+    with pytest.raises(ValueError):
+        read_exif_tag(tiff[:6], EXIF_TAG_ID_ORIENTATION)
+
+    # Cut in the Exif IFD.
+    exif_ifd_offset = tiff.index(struct.pack(BYTE_ORDERS[tiff_byte_order] + 'H', EXIF_TAG_ID_DATETIME_ORIGINAL))
+    with pytest.raises(ValueError):
+        read_exif_tag(tiff[:exif_ifd_offset], EXIF_TAG_ID_DATETIME_ORIGINAL)
+
+    # Cut in the value of the tag.
+    with pytest.raises(ValueError):
+        read_exif_tag(tiff[:-4], EXIF_TAG_ID_OFFSET_TIME_ORIGINAL)
+
+    # Cut in the JPEG segments, before the APP1 segment.
+    jpeg = build_jpeg(
+        (0xE0, JFIF_PAYLOAD),
+        (0xE1, b'Exif\x00\x00' + tiff),
+    )
+    with pytest.raises(ValueError):
+        read_exif_tag(jpeg[:12], EXIF_TAG_ID_ORIENTATION)
+
+
+@pytest.mark.parametrize('field_type', (FIELD_TYPE_SHORT, FIELD_TYPE_RATIONAL))
+@pytest.mark.parametrize('count', (10 ** 8, 2 ** 30, 2 ** 32 - 1))
+def test_read_exif_tag_huge_count(tiff_byte_order, field_type, count):
+    # A corrupted entry which number of values is far larger than the
+    # header must be rejected without allocating memory for these values.
+    tiff = build_tiff(tiff_byte_order, [(EXIF_TAG_ID_ORIENTATION, field_type, count, b'\x00' * 8)])
+    with pytest.raises(ValueError):
+        read_exif_tag(tiff, EXIF_TAG_ID_ORIENTATION)
+
+    assert get_photo_orientation(BytesIO(tiff)) is None
+    assert get_photo_orientation(BytesIO(build_jpeg((0xE1, b'Exif\x00\x00' + tiff)))) is None
+
+
+def test_read_exif_tag_invalid_byte_order():
+    jpeg = build_jpeg((0xE1, b'Exif\x00\x00XX\x00*\x00\x00\x00\x08\x00\x00'))
+    with pytest.raises(ValueError):
+        read_exif_tag(jpeg, EXIF_TAG_ID_ORIENTATION)
+
+
+def test_find_tiff_header_tiff(tiff_byte_order):
+    assert find_tiff_header(build_capture_time_tiff(tiff_byte_order)) == 0
+
+
+def test_find_tiff_header_jpeg():
+    jpeg = build_jpeg(
+        (0xE0, JFIF_PAYLOAD),
+        (0xE1, b'Exif\x00\x00' + build_capture_time_tiff(b'MM')),
+    )
+
+    # SOI marker, APP0 segment, APP1 marker and length, and Exif header.
+    assert find_tiff_header(jpeg) == 2 + (4 + len(JFIF_PAYLOAD)) + 4 + 6
+
+
+def test_find_tiff_header_jpeg_with_fill_bytes():
+    tiff = build_capture_time_tiff(b'II')
+    jpeg = build_jpeg((0xE1, b'Exif\x00\x00' + tiff))
+    jpeg = jpeg[:2] + b'\xff\xff' + jpeg[2:]
+    assert find_tiff_header(jpeg) == 2 + 2 + 4 + 6
+
+
+def test_find_tiff_header_jpeg_without_exif():
+    jpeg = build_jpeg((0xE0, JFIF_PAYLOAD))
+    assert find_tiff_header(jpeg) is None
+
+
+def test_find_tiff_header_unsupported_format():
+    with pytest.raises(ValueError):
+        find_tiff_header(b'\x89PNG\r\n\x1a\n' + b'\x00' * 16)
+
+
+def test_find_ifd_entry_inline_value(tiff_byte_order):
+    byte_order = BYTE_ORDERS[tiff_byte_order]
+    tiff = build_capture_time_tiff(tiff_byte_order)
+
+    # The first entry of the IFD0, stored right after the TIFF header and
+    # the number of entries of the IFD, holds its value.
+    assert find_ifd_entry(tiff, 0, byte_order, 8, EXIF_TAG_ID_ORIENTATION) \
+        == (FIELD_TYPE_SHORT, 1, 8 + 2 + 8)
+
+
+def test_find_ifd_entry_offset_value(tiff_byte_order):
+    byte_order = BYTE_ORDERS[tiff_byte_order]
+    jpeg = build_jpeg((0xE1, b'Exif\x00\x00' + build_capture_time_tiff(tiff_byte_order)))
+    tiff_offset = find_tiff_header(jpeg)
+
+    exif_ifd_entry = find_ifd_entry(jpeg, tiff_offset, byte_order, 8, EXIF_TAG_ID_EXIF_IFD_POINTER)
+    (exif_ifd_offset,) = struct.unpack_from(byte_order + 'L', jpeg, exif_ifd_entry[2])
+
+    field_type, count, value_offset = find_ifd_entry(
+        jpeg,
+        tiff_offset,
+        byte_order,
+        exif_ifd_offset,
+        EXIF_TAG_ID_DATETIME_ORIGINAL
+    )
+    assert (field_type, count) == (FIELD_TYPE_ASCII, len(DATETIME_ORIGINAL))
+    assert jpeg[value_offset:value_offset + count] == DATETIME_ORIGINAL
+
+
+def test_find_ifd_entry_missing(tiff_byte_order):
+    byte_order = BYTE_ORDERS[tiff_byte_order]
+    tiff = build_capture_time_tiff(tiff_byte_order)
+    assert find_ifd_entry(tiff, 0, byte_order, 8, EXIF_TAG_ID_DATETIME_ORIGINAL) is None
+
+
+@pytest.mark.parametrize('boundary', EXIF_HEADER_READ_SIZES)
+def test_get_photo_capture_time_value_straddling_header_boundary(tiff_byte_order, boundary, tmp_path):
+    photos = {'photo.tif': build_straddling_capture_time_tiff(tiff_byte_order, boundary)}
+
+    # The Exif metadata of a JPEG file are stored in a single APP1 segment,
+    # which is at most 64 KB long.  Its TIFF header follows the SOI marker,
+    # the APP1 marker and length, and the Exif header.
+    if boundary < 0xFFFF:
+        tiff = build_straddling_capture_time_tiff(tiff_byte_order, boundary, 12)
+        photos['photo.jpg'] = build_jpeg((0xE1, b'Exif\x00\x00' + tiff))
+
+    for name, data in photos.items():
+        value_offset = data.index(DATETIME_ORIGINAL)
+        assert value_offset < boundary < value_offset + len(DATETIME_ORIGINAL)
+
+        assert get_photo_capture_time(BytesIO(data)) == CAPTURE_TIME
+
+        file_path = tmp_path / name
+        file_path.write_bytes(data)
+        assert get_photo_capture_time(file_path) == CAPTURE_TIME
+
+
+def test_get_photo_capture_time_round_trip(tiff_byte_order, tmp_path):
+    photos = {
+        'photo.tif': build_capture_time_tiff(tiff_byte_order),
+        'photo.jpg': build_capture_time_jpeg(tiff_byte_order),
+    }
+
+    file_paths = []
+    for name, data in photos.items():
+        assert get_photo_capture_time(BytesIO(data)) == CAPTURE_TIME
+        assert get_photo_orientation(BytesIO(data)) == 6
+
+        file_path = tmp_path / name
+        file_path.write_bytes(data)
+        assert get_photo_capture_time(file_path) == CAPTURE_TIME
+        assert get_photo_orientation(file_path) == 6
+        file_paths.append(file_path)
+
+    assert get_photo_capture_times(file_paths) == [CAPTURE_TIME] * len(file_paths)
+
+
+def test_get_photo_capture_time_without_offset_time(tiff_byte_order):
+    jpeg = build_capture_time_jpeg(tiff_byte_order, offset_time_original=None)
+    assert get_photo_capture_time(BytesIO(jpeg)) == datetime(2024, 1, 2, 3, 4, 5)
+
+
+def test_get_photo_capture_time_without_exif(tmp_path):
+    jpeg = build_jpeg((0xE0, JFIF_PAYLOAD))
+    with pytest.raises(ValueError):
+        get_photo_capture_time(BytesIO(jpeg))
+
+    assert get_photo_capture_time(BytesIO(jpeg), strict=False) is None
+    assert get_photo_orientation(BytesIO(jpeg)) is None
+
+    file_path = tmp_path / 'photo.jpg'
+    file_path.write_bytes(build_capture_time_jpeg(b'II'))
+    other_file_path = tmp_path / 'other_photo.jpg'
+    other_file_path.write_bytes(jpeg)
+    assert get_photo_capture_times([file_path, other_file_path], strict=False) == [CAPTURE_TIME, None]
+
+    with pytest.raises(ValueError):
+        get_photo_capture_times([file_path, other_file_path])
+
+
+def test_get_photo_capture_time_reads_first_header_only(tiff_byte_order, exif_parse_sizes):
+    jpeg = build_capture_time_jpeg(tiff_byte_order, scan_data_size=1024 * 1024)
+    assert get_photo_capture_time(BytesIO(jpeg)) == CAPTURE_TIME
+    assert exif_parse_sizes == [EXIF_HEADER_READ_SIZES[0]]
+
+
+def test_get_photo_capture_time_reads_larger_headers(tiff_byte_order, exif_parse_sizes):
+    tiff = build_straddling_capture_time_tiff(tiff_byte_order, EXIF_HEADER_READ_SIZES[0])
+    tiff += b'\x00' * EXIF_HEADER_MAXIMUM_SIZE
+    assert get_photo_capture_time(BytesIO(tiff)) == CAPTURE_TIME
+    assert exif_parse_sizes == list(EXIF_HEADER_READ_SIZES[:2])
+
+
+def test_get_photo_capture_time_past_header_maximum_size(tiff_byte_order, exif_parse_sizes, tmp_path):
+    # The Exif metadata of the TIFF file follow its image data, beyond the
+    # maximum size of the header read: the whole file is parsed.
+    tiff = build_capture_time_tiff(tiff_byte_order, image_data_size=EXIF_HEADER_MAXIMUM_SIZE)
+    assert get_photo_capture_time(BytesIO(tiff)) == CAPTURE_TIME
+    assert exif_parse_sizes == [*EXIF_HEADER_READ_SIZES, EXIF_HEADER_MAXIMUM_SIZE, len(tiff)]
+    assert get_photo_orientation(BytesIO(tiff)) == 6
+
+    file_path = tmp_path / 'photo.tif'
+    file_path.write_bytes(tiff)
+    assert get_photo_capture_time(file_path) == CAPTURE_TIME
+    assert get_photo_capture_times([file_path]) == [CAPTURE_TIME]
+    assert get_photo_orientation(file_path) == 6
+
+
+def test_get_photo_capture_time_cache(exif_parse_sizes, tmp_path):
+    file_path = tmp_path / 'photo.tif'
+    file_path.write_bytes(build_capture_time_tiff(b'II'))
+    assert get_photo_capture_time(file_path) == CAPTURE_TIME
+
+    parse_count = len(exif_parse_sizes)
+    assert get_photo_capture_time(file_path) == CAPTURE_TIME
+    assert len(exif_parse_sizes) == parse_count
+
+    # The file is modified, without changing its size.
+    file_stat = file_path.stat()
+    file_path.write_bytes(build_capture_time_tiff(b'II', datetime_original=b'2023:12:31 23:59:58\x00'))
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+    assert get_photo_capture_time(file_path) == datetime(2023, 12, 31, 23, 59, 58, tzinfo=timezone(timedelta(hours=7)))
+
+    # The file is modified, without changing its modification time.
+    file_stat = file_path.stat()
+    file_path.write_bytes(build_capture_time_tiff(b'II', offset_time_original=None))
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    assert get_photo_capture_time(file_path) == datetime(2024, 1, 2, 3, 4, 5)
+
+
+@pytest.mark.parametrize('build_image', (build_jxl, build_png, build_webp))
+def test_get_photo_capture_time_other_formats(tiff_byte_order, build_image):
+    data = build_image(build_capture_time_tiff(tiff_byte_order))
+    assert get_photo_capture_time(BytesIO(data)) == CAPTURE_TIME
+    assert get_photo_orientation(BytesIO(data)) == 6
+
+
+@pytest.mark.parametrize(
+    'data',
+    (
+        b'',
+        b'Not an image file',
+        b'\x00\x00\x00\x18ftypisom\x00\x00\x02\x00isomiso2' + b'\x00' * 64,  # MP4 video
+        b'\x00\x00\x00\x18ftypheix\x00\x00\x00\x00mif1heix' + b'\x00' * 64,  # HEIF brand unknown to exifread
+    ),
+    ids=('empty', 'text', 'mp4', 'heix')
+)
+def test_get_photo_capture_time_unsupported_format(data, exif_parse_sizes):
+    assert get_photo_capture_time(BytesIO(data), strict=False) is None
+    with pytest.raises(ValueError):
+        get_photo_capture_time(BytesIO(data))
+
+    assert get_photo_orientation(BytesIO(data)) is None
+
+    # The file is rejected without being parsed by exifread.
+    assert exif_parse_sizes == []
+
+
+@pytest.mark.parametrize('image_data_size', (0, EXIF_HEADER_MAXIMUM_SIZE))
+def test_get_photo_capture_time_leaves_buffer_unchanged(tiff_byte_order, image_data_size):
+    tiff = build_capture_time_tiff(tiff_byte_order, image_data_size=image_data_size)
+    buffer = BytesIO(tiff)
+    buffer.seek(5)
+
+    assert get_photo_capture_time(buffer) == CAPTURE_TIME
+    assert get_photo_orientation(buffer) == 6
+    assert buffer.tell() == 5
+
+    # The buffer can still be resized, as no view on its content remains.
+    buffer.seek(0, os.SEEK_END)
+    buffer.write(b'\x00' * 16)
+    assert buffer.getvalue() == tiff + b'\x00' * 16